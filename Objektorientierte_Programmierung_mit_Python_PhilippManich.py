@@ -1,249 +1,494 @@
-"""
-Erweiterte Fahrzeugverwaltung mit OOP, Abstraktion, Polymorphismus und Datenpersistenz
-
-Dieses Skript demonstriert moderne OOP-Prinzipien mit einer Fahrzeugverwaltung:
-- Abstrakte Basisklasse für Fahrzeuge
-- Methodenüberschreibung und Polymorphismus
-- Kapselung mit Getter/Setter (@property)
-- Fehlerhandling mit try-except
-- Speichern und Laden von Fahrzeugdaten mit JSON
-- Benutzerinteraktion über ein Menü
-"""
-
-import json
-from abc import ABC, abstractmethod
-
-# Abstrakte Basisklasse für Fahrzeuge
-class Fahrzeug(ABC):
-    def __init__(self, marke: str, modell: str, baujahr: int, geschwindigkeit: int, beschleunigung: int):
-        self.marke = marke
-        self.modell = modell
-        self.baujahr = baujahr
-        self.geschwindigkeit = geschwindigkeit
-        self.beschleunigung = beschleunigung
-
-    @abstractmethod
-    def beschleunigen(self) -> str:
-        return f" {self.marke} {self.modell} beschleunigt in {self.beschleunigung} Sekunden auf 100 km/h!"
-
-    def __str__(self) -> str:
-        return f"{self.marke} {self.modell} ({self.baujahr}) | {self.geschwindigkeit} km/h"
-    
-    def to_dict(self) -> dict:
-        return {
-            "typ": self.__class__.__name__,
-            "marke": self.marke,
-            "modell": self.modell,
-            "baujahr": self.baujahr,
-            "geschwindigkeit": self.geschwindigkeit,
-            "beschleunigung": self.beschleunigung
-        }
-
-    @staticmethod
-    def from_dict(data: dict):
-        typ = data.get("typ", None)
-        data = dict(data)  # Kopie, damit original nicht verändert wird
-        data.pop("typ", None)  # Entfernt 'typ', falls vorhanden
-
-        if typ == "Auto":
-            return Auto(**data)
-        elif typ == "Elektroauto":
-            return Elektroauto(**data)
-        elif typ == "Motorrad":
-            return Motorrad(**data)
-        return None
-
-
-# Klasse Auto (erbt von Fahrzeug)
-class Auto(Fahrzeug):
-    def __init__(self, marke: str, modell: str, baujahr: int, geschwindigkeit: int, beschleunigung: int, kraftstoff: str):
-        super().__init__(marke, modell, baujahr, geschwindigkeit, beschleunigung)
-        self.kraftstoff = kraftstoff
-        
-    def beschleunigen(self) -> str:
-        return super().beschleunigen()
-
-    def __str__(self) -> str:
-        return super().__str__() + f" | Kraftstoff: {self.kraftstoff}"
-
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data["kraftstoff"] = self.kraftstoff
-        return data
-    
-# Klasse Motorrad (erbt von Fahrzeug)
-class Motorrad(Fahrzeug):
-    def __init__(self, marke: str, modell: str, baujahr: int, geschwindigkeit: int, beschleunigung: int, kraftstoff: str):
-        super().__init__(marke, modell, baujahr, geschwindigkeit, beschleunigung)
-        self.kraftstoff = kraftstoff
-        
-    def beschleunigen(self) -> str:
-        return super().beschleunigen()
-
-    def __str__(self) -> str:
-        return super().__str__() + f" | Kraftstoff: {self.kraftstoff}"
-
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data["kraftstoff"] = self.kraftstoff
-        return data
-
-# Klasse Elektroauto (erbt von Fahrzeug)
-class Elektroauto(Fahrzeug):
-    def __init__(self, marke: str, modell: str, baujahr: int, geschwindigkeit: int, beschleunigung: int, energiequelle: str):
-        super().__init__(marke, modell, baujahr, geschwindigkeit, beschleunigung)
-        self.energiequelle = energiequelle
-    
-    def beschleunigen(self) -> str:
-        return super().beschleunigen()
-
-    def __str__(self) -> str:
-        return super().__str__() + f" | Energiequelle: {self.energiequelle}"
-
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data["energiequelle"] = self.energiequelle
-        return data
-
-# Klasse Fahrzeugverwaltung mit Datenpersistenz
-class Fahrzeugverwaltung:
-    DATEI = "fahrzeuge.json"
-
-    def __init__(self):
-        self.fahrzeuge = []
-        self.laden()
-
-    def fahrzeug_hinzufuegen(self, fahrzeug: Fahrzeug) -> None:
-        self.fahrzeuge.append(fahrzeug)
-        self.speichern()
-
-    def alle_fahrzeuge_anzeigen(self) -> None:
-        if not self.fahrzeuge:
-            print(" Keine Fahrzeuge vorhanden.")
-        else:
-            print("\n Fahrzeugliste:")
-            for f in self.fahrzeuge:
-                print(f"  - {f} | Beschleunigung: {f.beschleunigung} Sek")
-
-
-    def beschleunigungsinfo(self) -> None:
-        if not self.fahrzeuge:
-            print(" Keine Fahrzeuge vorhanden.")
-        else:
-            print("\n Beschleunigung der Fahrzeuge:")
-            for f in self.fahrzeuge:
-                print(f"  {f.beschleunigen()}")
-
-    def speichern(self) -> None:
-        try:
-            with open(self.DATEI, "w") as file:
-                json.dump([f.to_dict() for f in self.fahrzeuge], file, indent=4)
-        except Exception as e:
-            print(f" Fehler beim Speichern: {e}")
-
-    def laden(self) -> None:
-        try:
-            with open(self.DATEI, "r") as file:
-                daten = json.load(file)
-                self.fahrzeuge = []
-                for item in daten:
-                    try:
-                        fzg = Fahrzeug.from_dict(item)
-                        if fzg:
-                            self.fahrzeuge.append(fzg)
-                    except Exception as e:
-                        print(f" Ungültiger Eintrag übersprungen: {e}")
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass  # Falls Datei fehlt oder leer ist, nichts tun
-            
-            
-# ------------------
-# Eingabe-Funktionen
-# ------------------
-
-def eingabe_string(prompt: str) -> str:
-    wert = ""
-    while not wert.strip():
-        wert = input(prompt).strip()
-        if not wert:
-            print(" Eingabe darf nicht leer sein.")
-    return wert
-
-def eingabe_int(prompt: str) -> int:
-    while True:
-        eingabe = input(prompt)
-        if not eingabe.strip():
-            print(" Eingabe darf nicht leer sein.")
-            continue
-        try:
-            return int(eingabe)
-        except ValueError:
-            print(" Bitte eine gültige Zahl eingeben.")
-
-def eingabe_float(prompt: str) -> float:
-    while True:
-        eingabe = input(prompt).replace(",", ".")
-        if not eingabe.strip():
-            print(" Eingabe darf nicht leer sein.")
-            continue
-        try:
-            return float(eingabe)
-        except ValueError:
-            print(" Bitte eine gültige Kommazahl eingeben.")
-
-
-
-# Benutzerinteraktion
-if __name__ == "__main__":
-    verwaltung = Fahrzeugverwaltung()
-
-    while True:
-        print("\nMenü Fahrzeugverwaltung:")
-        print("1. Auto hinzufügen")
-        print("2. Elektroauto hinzufügen")
-        print("3. Motorrad hinzufügen")
-        print("4. Alle Fahrzeuge anzeigen")
-        print("5. Beschleunigung der Fahrzeuge")
-        print("6. Beenden")
-        
-        auswahl = input("-> Option wählen: ")
-
-        if auswahl == "1":
-            marke = eingabe_string(" Marke: ")
-            modell = eingabe_string(" Modell: ")
-            baujahr = eingabe_int(" Baujahr: ")
-            geschwindigkeit = eingabe_int(" Höchstgeschwindigkeit (km/h): ")
-            beschleunigung = eingabe_float(" Beschleunigung (Sekunden auf 100 km/h): ")
-            kraftstoff = eingabe_string(" Kraftstoff: ")
-            verwaltung.fahrzeug_hinzufuegen(Auto(marke, modell, baujahr, geschwindigkeit, beschleunigung, kraftstoff))
-        
-        elif auswahl == "2":
-            marke = eingabe_string(" Marke: ")
-            modell = eingabe_string(" Modell: ")
-            baujahr = eingabe_int(" Baujahr: ")
-            geschwindigkeit = eingabe_int(" Höchstgeschwindigkeit (km/h): ")
-            beschleunigung = eingabe_float(" Beschleunigung (Sekunden auf 100 km/h): ")
-            energiequelle = eingabe_string(" Energiequelle: ")
-            verwaltung.fahrzeug_hinzufuegen(Elektroauto(marke, modell, baujahr, geschwindigkeit, beschleunigung, energiequelle))
-
-        elif auswahl == "3":
-            marke = eingabe_string(" Marke: ")
-            modell = eingabe_string(" Modell: ")
-            baujahr = eingabe_int(" Baujahr: ")
-            geschwindigkeit = eingabe_int(" Höchstgeschwindigkeit (km/h): ")
-            beschleunigung = eingabe_float(" Beschleunigung (Sekunden auf 100 km/h): ")
-            kraftstoff = eingabe_string(" Kraftstoff: ")
-            verwaltung.fahrzeug_hinzufuegen(Motorrad(marke, modell, baujahr, geschwindigkeit, beschleunigung, kraftstoff))
-
-        elif auswahl == "4":
-            verwaltung.alle_fahrzeuge_anzeigen()
-        
-        elif auswahl == "5":
-            verwaltung.beschleunigungsinfo()
-
-        elif auswahl == "6":
-            print(" Programm beendet.")
-            break
-
-        else:
-            print(" Ungültige Eingabe. Bitte erneut versuchen.")
+"""
+Erweiterte Fahrzeugverwaltung mit OOP, Abstraktion, Polymorphismus und Datenpersistenz
+
+Dieses Skript demonstriert moderne OOP-Prinzipien mit einer Fahrzeugverwaltung:
+- Abstrakte Basisklasse für Fahrzeuge
+- Methodenüberschreibung und Polymorphismus
+- Kapselung mit Getter/Setter (@property)
+- Fehlerhandling mit try-except
+- Speichern und Laden von Fahrzeugdaten mit JSON
+- Benutzerinteraktion über ein Menü
+"""
+
+import json
+import mmap
+import operator
+import os
+import re
+import sys
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+# Schnellste verfügbare JSON-Bibliothek wählen: orjson (ca. 5-6x schneller
+# als die Standardbibliothek) vor ujson (ca. 2-3x, z.B. wenn für die
+# Plattform keine orjson-Wheels existieren) vor dem json-Modul. _dumps und
+# _loads arbeiten in allen drei Fällen einheitlich mit Bytes.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+
+        def _dumps(obj) -> bytes:
+            return ujson.dumps(obj, indent=2).encode("utf-8")
+
+        def _loads(daten):
+            return ujson.loads(bytes(daten))
+    except ImportError:
+        # Ohne schnelle JSON-Bibliothek streamt speichern() die Elemente
+        # einzeln (siehe _FahrzeugEncoder) statt einen Puffer zu bauen
+        _dumps = None
+
+        def _loads(daten):
+            # bytes(bytes) ist eine No-Op, bytes(mmap) kopiert nur hier -
+            # json.loads versteht das Buffer-Protokoll nicht direkt
+            return json.loads(bytes(daten))
+
+# NumPy/Numba sind nur für die Flottenstatistik nötig; ohne sie läuft der
+# Rest des Programms unverändert weiter
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Abstrakte Basisklasse für Fahrzeuge.
+# @dataclass(slots=True) erzeugt __init__, __repr__ und __eq__ samt
+# __slots__ automatisch - die generierten Methoden kommen mit weniger
+# Bytecode aus als die früheren handgeschriebenen Konstruktoren
+@dataclass(slots=True)
+class Fahrzeug(ABC):
+    marke: str
+    modell: str
+    baujahr: int
+    geschwindigkeit: int
+    beschleunigung: int
+    # Zwischenspeicher für beschleunigen(); kein __init__-Parameter
+    _beschleunigen_cache: str = field(default=None, init=False, repr=False, compare=False)
+
+    # Gemeinsame Felder aller Fahrzeuge; Unterklassen ergänzen _EXTRA.
+    # Der attrgetter wird pro Klasse einmal gebaut, damit to_dict ohne
+    # wiederholte Attribut-Lookups und super()-Ketten auskommt.
+    _FIELDS = ("marke", "modell", "baujahr", "geschwindigkeit", "beschleunigung")
+    _EXTRA = ()
+
+    # Fertige Format-Vorlagen (Indizes zeigen in das _GETTER-Tupel):
+    # eine einzige String-Allokation pro Aufruf statt verketteter f-Strings.
+    # Die Vorlage für __str__ wird in __init_subclass__ pro Klasse um die
+    # _EXTRA-Felder ergänzt (z.B. "| Kraftstoff: ...")
+    _STR_FMT = "{0} {1} ({2}) | {3} km/h"
+    _BESCHL_FMT = " {0} {1} beschleunigt in {4} Sekunden auf 100 km/h!"
+
+    # Registry für from_dict: Typname -> Klasse, O(1)-Lookup statt if/elif-Kette.
+    # Neue Fahrzeugtypen registrieren sich über __init_subclass__ von selbst.
+    _TYP_REGISTRY = {}
+
+    def __init_subclass__(cls, **kwargs):
+        cls._ALL_FIELDS = cls._FIELDS + cls._EXTRA
+        cls._GETTER = staticmethod(operator.attrgetter(*cls._ALL_FIELDS))
+        # Schlüssel samt "typ" und der konstante Typname vorab, damit to_dict
+        # mit genau einer Dict-Allokation ohne nachträgliches Einfügen auskommt
+        cls._DICT_KEYS = ("typ",) + cls._ALL_FIELDS
+        cls._TYP_NAME = cls.__name__
+        cls._STR_FMT = Fahrzeug._STR_FMT + "".join(
+            f" | {feld.capitalize()}: {{{i}}}"
+            for i, feld in enumerate(cls._EXTRA, start=len(cls._FIELDS))
+        )
+        Fahrzeug._TYP_REGISTRY[cls.__name__] = cls
+
+    @abstractmethod
+    def beschleunigen(self) -> str:
+        # Die Felder ändern sich nach der Konstruktion nicht mehr, also wird
+        # der String nur beim ersten Aufruf formatiert und danach aus dem
+        # Slot gelesen (functools.cached_property braucht ein __dict__ und
+        # funktioniert daher nicht mit __slots__)
+        if self._beschleunigen_cache is None:
+            self._beschleunigen_cache = self._BESCHL_FMT.format(*self._GETTER(self))
+        return self._beschleunigen_cache
+
+    def __str__(self) -> str:
+        return self._STR_FMT.format(*self._GETTER(self))
+
+
+    def to_dict(self) -> dict:
+        return dict(zip(self._DICT_KEYS, (self._TYP_NAME,) + self._GETTER(self)))
+
+    @staticmethod
+    def from_dict(data: dict):
+        # Keine Kopie nötig: laden() besitzt das frisch geparste Dict selbst
+        klasse = Fahrzeug._TYP_REGISTRY.get(data.pop("typ", None))
+        return klasse(**data) if klasse else None
+
+
+# Klasse Auto (erbt von Fahrzeug)
+@dataclass(slots=True)
+class Auto(Fahrzeug):
+    kraftstoff: str
+    # Diskriminator als Dataclass-Feld, damit orjson ihn beim nativen
+    # Serialisieren mitschreibt; kein __init__-Parameter
+    typ: str = field(default="Auto", init=False, repr=False, compare=False)
+
+    _EXTRA = ("kraftstoff",)
+
+    def __post_init__(self):
+        # Interning: "Benzin"/"Diesel" usw. existieren pro Flotte nur einmal
+        # im Speicher statt einmal pro Fahrzeug
+        self.kraftstoff = sys.intern(self.kraftstoff)
+
+    def beschleunigen(self) -> str:
+        # Explizit statt super(): slots=True erzeugt die Klasse neu, wodurch
+        # parameterloses super() vor Python 3.12 ins Leere greift
+        return Fahrzeug.beschleunigen(self)
+
+
+# Klasse Motorrad (erbt von Fahrzeug)
+@dataclass(slots=True)
+class Motorrad(Fahrzeug):
+    kraftstoff: str
+    # Diskriminator als Dataclass-Feld, damit orjson ihn beim nativen
+    # Serialisieren mitschreibt; kein __init__-Parameter
+    typ: str = field(default="Motorrad", init=False, repr=False, compare=False)
+
+    _EXTRA = ("kraftstoff",)
+
+    def __post_init__(self):
+        # Interning: "Benzin"/"Diesel" usw. existieren pro Flotte nur einmal
+        # im Speicher statt einmal pro Fahrzeug
+        self.kraftstoff = sys.intern(self.kraftstoff)
+
+    def beschleunigen(self) -> str:
+        # Explizit statt super(): slots=True erzeugt die Klasse neu, wodurch
+        # parameterloses super() vor Python 3.12 ins Leere greift
+        return Fahrzeug.beschleunigen(self)
+
+# Klasse Elektroauto (erbt von Fahrzeug)
+@dataclass(slots=True)
+class Elektroauto(Fahrzeug):
+    energiequelle: str
+    # Diskriminator als Dataclass-Feld, damit orjson ihn beim nativen
+    # Serialisieren mitschreibt; kein __init__-Parameter
+    typ: str = field(default="Elektroauto", init=False, repr=False, compare=False)
+
+    _EXTRA = ("energiequelle",)
+
+    def __post_init__(self):
+        # Interning wie bei Auto/Motorrad: gleiche Energiequellen teilen
+        # sich ein String-Objekt
+        self.energiequelle = sys.intern(self.energiequelle)
+
+    def beschleunigen(self) -> str:
+        # Explizit statt super(): slots=True erzeugt die Klasse neu, wodurch
+        # parameterloses super() vor Python 3.12 ins Leere greift
+        return Fahrzeug.beschleunigen(self)
+
+if np is not None:
+    def _stats(arr):
+        # Mittelwert/Minimum/Maximum je Spalte in einem einzigen Durchlauf.
+        # Als expliziter Schleifen-Kernel geschrieben, damit Numba ihn per
+        # @njit auf nahezu C-Geschwindigkeit kompilieren kann.
+        n, m = arr.shape
+        mittel = np.zeros(m, np.float32)
+        kleinstes = np.full(m, np.inf, dtype=np.float32)
+        groesstes = np.full(m, -np.inf, dtype=np.float32)
+        for i in range(n):
+            for j in range(m):
+                wert = arr[i, j]
+                mittel[j] += wert
+                if wert < kleinstes[j]:
+                    kleinstes[j] = wert
+                if wert > groesstes[j]:
+                    groesstes[j] = wert
+        mittel /= n
+        return mittel, kleinstes, groesstes
+
+    if njit is not None:
+        # cache=True speichert den kompilierten Kernel auf der Platte und
+        # erspart die Neukompilierung bei jedem Programmstart
+        _stats = njit(cache=True)(_stats)
+
+
+class _FahrzeugEncoder(json.JSONEncoder):
+    # Lässt json.iterencode Fahrzeug-Objekte direkt serialisieren, sodass
+    # beim Speichern immer nur ein Dict gleichzeitig im Speicher liegt
+    # statt der kompletten Liste
+    def default(self, o):
+        if isinstance(o, Fahrzeug):
+            return o.to_dict()
+        return super().default(o)
+
+
+# Zwischenspeicher für bereits geparste Dateien: (Pfad, mtime, Größe) ->
+# Fahrzeug-Tupel. Solange sich die Datei nicht geändert hat, entfällt das
+# erneute Parsen komplett - z.B. wenn mehrere Verwaltungen im selben
+# Prozess angelegt werden
+_PARSE_CACHE = {}
+
+
+# Klasse Fahrzeugverwaltung mit Datenpersistenz
+class Fahrzeugverwaltung:
+    DATEI = "fahrzeuge.json"
+
+    def __init__(self):
+        # None = noch nicht geladen; die Datei wird erst beim ersten Zugriff
+        # auf fahrzeuge geparst statt bei jedem Programmstart
+        self._fahrzeuge = None
+        self._dirty = False
+        self._batching = 0
+        self._soa = None
+
+    @property
+    def fahrzeuge(self) -> list:
+        if self._fahrzeuge is None:
+            self.laden()
+        return self._fahrzeuge
+
+    def fahrzeug_hinzufuegen(self, fahrzeug: Fahrzeug) -> None:
+        self.fahrzeuge.append(fahrzeug)
+        self._dirty = True
+        self._soa = None
+        if not self._batching:
+            self.speichern()
+
+    @contextmanager
+    def batch(self):
+        """Sammelt mehrere Einfügungen und schreibt die Datei erst am Ende.
+
+        Ohne Batch schreibt jedes fahrzeug_hinzufuegen die komplette Datei
+        neu (O(n) pro Einfügung). Für Skripte, die viele Fahrzeuge auf einmal
+        anlegen: `with verwaltung.batch(): ...`
+        """
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if not self._batching:
+                self.flush()
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.speichern()
+
+    def alle_fahrzeuge_anzeigen(self) -> None:
+        if not self.fahrzeuge:
+            print(" Keine Fahrzeuge vorhanden.")
+        else:
+            print("\n Fahrzeugliste:")
+            for f in self.fahrzeuge:
+                print(f"  - {f} | Beschleunigung: {f.beschleunigung} Sek")
+
+
+    def beschleunigungsinfo(self) -> None:
+        if not self.fahrzeuge:
+            print(" Keine Fahrzeuge vorhanden.")
+        else:
+            print("\n Beschleunigung der Fahrzeuge:")
+            for f in self.fahrzeuge:
+                print(f"  {f.beschleunigen()}")
+
+    def _numeric_soa(self):
+        # Numerische Felder als zusammenhängendes 2D-Array (eine Zeile pro
+        # Fahrzeug, Spalten = baujahr/geschwindigkeit/beschleunigung).
+        # Die Fahrzeugliste bleibt die eigentliche Datenquelle; das Array
+        # wird nur einmal aufgebaut und bei Änderungen der Flotte verworfen,
+        # sodass wiederholte Auswertungen auf der fertigen Spaltenansicht
+        # arbeiten statt die Objekte erneut abzulaufen
+        if self._soa is None:
+            self._soa = np.array(
+                [(f.baujahr, f.geschwindigkeit, f.beschleunigung) for f in self.fahrzeuge],
+                dtype=np.float32,
+            )
+        return self._soa
+
+    def statistiken(self) -> None:
+        if not self.fahrzeuge:
+            print(" Keine Fahrzeuge vorhanden.")
+            return
+        if np is None:
+            print(" Statistiken benötigen NumPy (pip install numpy).")
+            return
+        mittel, kleinstes, groesstes = _stats(self._numeric_soa())
+        print("\n Flottenstatistik:")
+        spalten = ("Baujahr", "Geschwindigkeit (km/h)", "Beschleunigung (Sek)")
+        for j, name in enumerate(spalten):
+            print(f"  {name}: Durchschnitt {mittel[j]:.1f} | Minimum {kleinstes[j]:.1f} | Maximum {groesstes[j]:.1f}")
+
+    def speichern(self) -> None:
+        try:
+            # Atomar schreiben: erst in Temporärdatei, dann per os.replace
+            # umbenennen - bei einem Absturz bleibt die alte Datei intakt
+            tmp = self.DATEI + ".tmp"
+            with open(tmp, "wb", buffering=1 << 16) as file:
+                if orjson is not None:
+                    # orjson serialisiert Dataclass-Instanzen direkt - die
+                    # komplette to_dict-Zwischenliste entfällt (Felder mit
+                    # führendem Unterstrich wie der Cache bleiben außen vor)
+                    file.write(orjson.dumps(
+                        self.fahrzeuge,
+                        option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_INDENT_2,
+                    ))
+                elif _dumps is not None:
+                    # Liste vorab in voller Länge anlegen und per Index
+                    # füllen, dann ein einziges write() statt vieler
+                    # kleiner Schreibaufrufe
+                    daten = [None] * len(self.fahrzeuge)
+                    for i, f in enumerate(self.fahrzeuge):
+                        daten[i] = f.to_dict()
+                    file.write(_dumps(daten))
+                else:
+                    # Standardbibliothek: elementweise streamen, damit nie
+                    # die komplette Dict-Liste gleichzeitig im Speicher liegt
+                    for chunk in _FahrzeugEncoder(indent=4).iterencode(self.fahrzeuge):
+                        file.write(chunk.encode("utf-8"))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp, self.DATEI)
+            self._dirty = False
+        except Exception as e:
+            print(f" Fehler beim Speichern: {e}")
+
+    def laden(self) -> None:
+        self._fahrzeuge = []
+        self._soa = None
+        try:
+            st = os.stat(self.DATEI)
+        except FileNotFoundError:
+            return
+        schluessel = (self.DATEI, st.st_mtime_ns, st.st_size)
+        geparst = _PARSE_CACHE.get(schluessel)
+        if geparst is not None:
+            self._fahrzeuge = list(geparst)
+            return
+        try:
+            with open(self.DATEI, "rb") as file:
+                # mmap statt read(): orjson parst über das Buffer-Protokoll
+                # direkt aus dem Seiten-Cache, ohne die Datei vorher in ein
+                # eigenes Bytes-Objekt zu kopieren
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # memoryview ist kopierfrei; orjson akzeptiert das
+                    # mmap-Objekt selbst nicht als Eingabe
+                    with memoryview(mm) as sicht:
+                        daten = _loads(sicht)
+                for item in daten:
+                    try:
+                        fzg = Fahrzeug.from_dict(item)
+                        if fzg:
+                            self._fahrzeuge.append(fzg)
+                    except Exception as e:
+                        print(f" Ungültiger Eintrag übersprungen: {e}")
+            _PARSE_CACHE[schluessel] = tuple(self._fahrzeuge)
+        except (FileNotFoundError, ValueError):
+            # ValueError deckt die Decode-Fehler aller drei JSON-Bibliotheken
+            # ab; falls Datei fehlt oder leer ist, nichts tun
+            pass
+            
+            
+# ------------------
+# Eingabe-Funktionen
+# ------------------
+
+# Vorab kompilierte Muster: Eingaben werden per Regex geprüft statt über
+# try-except um int()/float() - das Werfen und Fangen von ValueError ist
+# in CPython deutlich teurer als ein Regex-Match
+_INT_RE = re.compile(r"^-?\d+$")
+_FLOAT_RE = re.compile(r"^-?\d+(\.\d+)?$")
+
+def eingabe_string(prompt: str) -> str:
+    wert = ""
+    while not wert.strip():
+        wert = input(prompt).strip()
+        if not wert:
+            print(" Eingabe darf nicht leer sein.")
+    return wert
+
+def eingabe_int(prompt: str) -> int:
+    while True:
+        eingabe = input(prompt).strip()
+        if not eingabe:
+            print(" Eingabe darf nicht leer sein.")
+            continue
+        if _INT_RE.match(eingabe):
+            return int(eingabe)
+        print(" Bitte eine gültige Zahl eingeben.")
+
+def eingabe_float(prompt: str) -> float:
+    while True:
+        eingabe = input(prompt).strip().replace(",", ".")
+        if not eingabe:
+            print(" Eingabe darf nicht leer sein.")
+            continue
+        if _FLOAT_RE.match(eingabe):
+            return float(eingabe)
+        print(" Bitte eine gültige Kommazahl eingeben.")
+
+
+
+# Benutzerinteraktion
+if __name__ == "__main__":
+    verwaltung = Fahrzeugverwaltung()
+
+    while True:
+        print("\nMenü Fahrzeugverwaltung:")
+        print("1. Auto hinzufügen")
+        print("2. Elektroauto hinzufügen")
+        print("3. Motorrad hinzufügen")
+        print("4. Alle Fahrzeuge anzeigen")
+        print("5. Beschleunigung der Fahrzeuge")
+        print("6. Flottenstatistik")
+        print("7. Beenden")
+        
+        auswahl = input("-> Option wählen: ")
+
+        if auswahl == "1":
+            marke = eingabe_string(" Marke: ")
+            modell = eingabe_string(" Modell: ")
+            baujahr = eingabe_int(" Baujahr: ")
+            geschwindigkeit = eingabe_int(" Höchstgeschwindigkeit (km/h): ")
+            beschleunigung = eingabe_float(" Beschleunigung (Sekunden auf 100 km/h): ")
+            kraftstoff = eingabe_string(" Kraftstoff: ")
+            verwaltung.fahrzeug_hinzufuegen(Auto(marke, modell, baujahr, geschwindigkeit, beschleunigung, kraftstoff))
+        
+        elif auswahl == "2":
+            marke = eingabe_string(" Marke: ")
+            modell = eingabe_string(" Modell: ")
+            baujahr = eingabe_int(" Baujahr: ")
+            geschwindigkeit = eingabe_int(" Höchstgeschwindigkeit (km/h): ")
+            beschleunigung = eingabe_float(" Beschleunigung (Sekunden auf 100 km/h): ")
+            energiequelle = eingabe_string(" Energiequelle: ")
+            verwaltung.fahrzeug_hinzufuegen(Elektroauto(marke, modell, baujahr, geschwindigkeit, beschleunigung, energiequelle))
+
+        elif auswahl == "3":
+            marke = eingabe_string(" Marke: ")
+            modell = eingabe_string(" Modell: ")
+            baujahr = eingabe_int(" Baujahr: ")
+            geschwindigkeit = eingabe_int(" Höchstgeschwindigkeit (km/h): ")
+            beschleunigung = eingabe_float(" Beschleunigung (Sekunden auf 100 km/h): ")
+            kraftstoff = eingabe_string(" Kraftstoff: ")
+            verwaltung.fahrzeug_hinzufuegen(Motorrad(marke, modell, baujahr, geschwindigkeit, beschleunigung, kraftstoff))
+
+        elif auswahl == "4":
+            verwaltung.alle_fahrzeuge_anzeigen()
+        
+        elif auswahl == "5":
+            verwaltung.beschleunigungsinfo()
+
+        elif auswahl == "6":
+            verwaltung.statistiken()
+
+        elif auswahl == "7":
+            print(" Programm beendet.")
+            break
+
+        else:
+            print(" Ungültige Eingabe. Bitte erneut versuchen.")